@@ -0,0 +1,1011 @@
+import { useState, useEffect } from 'react'
+import { BrowserRouter as Router, Routes, Route, Navigate } from 'react-router-dom'
+import { motion, AnimatePresence } from 'framer-motion'
+import { 
+  Brain, 
+  Code, 
+  Database, 
+  GitBranch, 
+  SettingsIcon, 
+  BarChart3, 
+  Users, 
+  Zap,
+  Activity,
+  FileText,
+  Search,
+  Play,
+  Pause,
+  RefreshCw,
+  CheckCircle,
+  AlertCircle,
+  TrendingUp,
+  Cpu,
+  Network,
+  BookOpen,
+  Target,
+  Lightbulb,
+  Layers
+} from 'lucide-react'
+import { Button } from '@/components/ui/button.jsx'
+import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card.jsx'
+import { Badge } from '@/components/ui/badge.jsx'
+import { Progress } from '@/components/ui/progress.jsx'
+import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs.jsx'
+import { Input } from '@/components/ui/input.jsx'
+import { Textarea } from '@/components/ui/textarea.jsx'
+import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select.jsx'
+import { Switch } from '@/components/ui/switch.jsx'
+import { Separator } from '@/components/ui/separator.jsx'
+import { ScrollArea } from '@/components/ui/scroll-area.jsx'
+import { LineChart, Line, AreaChart, Area, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts'
+import './App.css'
+
+// Mock data for demonstration
+const mockSystemStats = {
+  totalProjects: 42,
+  activeProjects: 8,
+  codeGenerated: 15420,
+  successRate: 94.2,
+  learningPatterns: 156,
+  knowledgeEntities: 2847
+}
+
+const mockPerformanceData = [
+  { name: 'Jan', codeQuality: 85, testCoverage: 78, userSatisfaction: 92 },
+  { name: 'Feb', codeQuality: 88, testCoverage: 82, userSatisfaction: 94 },
+  { name: 'Mar', codeQuality: 91, testCoverage: 85, userSatisfaction: 96 },
+  { name: 'Apr', codeQuality: 93, testCoverage: 89, userSatisfaction: 97 },
+  { name: 'May', codeQuality: 95, testCoverage: 92, userSatisfaction: 98 },
+  { name: 'Jun', codeQuality: 97, testCoverage: 94, userSatisfaction: 99 }
+]
+
+const mockLearningData = [
+  { name: 'Error Correction', value: 35, color: '#8884d8' },
+  { name: 'Style Preferences', value: 25, color: '#82ca9d' },
+  { name: 'Performance Optimization', value: 20, color: '#ffc658' },
+  { name: 'Testing Patterns', value: 20, color: '#ff7300' }
+]
+
+const mockRecentActivities = [
+  { id: 1, type: 'code_generation', description: 'Generated Python function for data processing', timestamp: '2 minutes ago', status: 'success' },
+  { id: 2, type: 'learning', description: 'Learned new pattern from user feedback', timestamp: '5 minutes ago', status: 'success' },
+  { id: 3, type: 'analysis', description: 'Completed static analysis on project Alpha', timestamp: '8 minutes ago', status: 'success' },
+  { id: 4, type: 'integration', description: 'Synced with GitHub repository', timestamp: '12 minutes ago', status: 'success' },
+  { id: 5, type: 'optimization', description: 'Applied performance optimization patterns', timestamp: '15 minutes ago', status: 'warning' }
+]
+
+// Navigation Component
+const Navigation = ({ activeTab, setActiveTab }) => {
+  const navItems = [
+    { id: 'dashboard', label: 'Dashboard', icon: BarChart3 },
+    { id: 'code-generation', label: 'Code Generation', icon: Code },
+    { id: 'knowledge-graph', label: 'Knowledge Graph', icon: Network },
+    { id: 'learning', label: 'Learning Center', icon: Brain },
+    { id: 'analytics', label: 'Analytics', icon: TrendingUp },
+    { id: 'settings', label: 'Settings', icon: SettingsIcon }
+  ]
+
+  return (
+    <nav className="w-64 bg-sidebar border-r border-sidebar-border p-4">
+      <div className="flex items-center gap-2 mb-8">
+        <div className="w-8 h-8 bg-primary rounded-lg flex items-center justify-center">
+          <Brain className="w-5 h-5 text-primary-foreground" />
+        </div>
+        <div>
+          <h1 className="text-lg font-bold text-sidebar-foreground">Unified Orchestrator</h1>
+          <p className="text-xs text-sidebar-foreground/60">AI Control Center</p>
+        </div>
+      </div>
+      
+      <div className="space-y-2">
+        {navItems.map((item) => {
+          const Icon = item.icon
+          return (
+            <Button
+              key={item.id}
+              variant={activeTab === item.id ? "default" : "ghost"}
+              className="w-full justify-start gap-3"
+              onClick={() => setActiveTab(item.id)}
+            >
+              <Icon className="w-4 h-4" />
+              {item.label}
+            </Button>
+          )
+        })}
+      </div>
+      
+      <div className="mt-8 p-4 bg-sidebar-accent rounded-lg">
+        <div className="flex items-center gap-2 mb-2">
+          <Activity className="w-4 h-4 text-green-500" />
+          <span className="text-sm font-medium text-sidebar-foreground">System Status</span>
+        </div>
+        <p className="text-xs text-sidebar-foreground/60">All systems operational</p>
+        <div className="mt-2 flex gap-1">
+          <div className="w-2 h-2 bg-green-500 rounded-full animate-pulse"></div>
+          <div className="w-2 h-2 bg-green-500 rounded-full animate-pulse" style={{animationDelay: '0.2s'}}></div>
+          <div className="w-2 h-2 bg-green-500 rounded-full animate-pulse" style={{animationDelay: '0.4s'}}></div>
+        </div>
+      </div>
+    </nav>
+  )
+}
+
+// Dashboard Component
+const Dashboard = () => {
+  return (
+    <div className="space-y-6">
+      <div className="flex items-center justify-between">
+        <div>
+          <h2 className="text-3xl font-bold text-foreground">Dashboard</h2>
+          <p className="text-muted-foreground">Overview of your AI orchestration system</p>
+        </div>
+        <div className="flex gap-2">
+          <Button variant="outline" size="sm">
+            <RefreshCw className="w-4 h-4 mr-2" />
+            Refresh
+          </Button>
+          <Button size="sm">
+            <Play className="w-4 h-4 mr-2" />
+            Start Session
+          </Button>
+        </div>
+      </div>
+
+      {/* Stats Cards */}
+      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
+        <Card className="hover:shadow-lg transition-shadow">
+          <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
+            <CardTitle className="text-sm font-medium">Total Projects</CardTitle>
+            <FileText className="h-4 w-4 text-muted-foreground" />
+          </CardHeader>
+          <CardContent>
+            <div className="text-2xl font-bold">{mockSystemStats.totalProjects}</div>
+            <p className="text-xs text-muted-foreground">+12% from last month</p>
+          </CardContent>
+        </Card>
+
+        <Card className="hover:shadow-lg transition-shadow">
+          <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
+            <CardTitle className="text-sm font-medium">Code Generated</CardTitle>
+            <Code className="h-4 w-4 text-muted-foreground" />
+          </CardHeader>
+          <CardContent>
+            <div className="text-2xl font-bold">{mockSystemStats.codeGenerated.toLocaleString()}</div>
+            <p className="text-xs text-muted-foreground">Lines of code this month</p>
+          </CardContent>
+        </Card>
+
+        <Card className="hover:shadow-lg transition-shadow">
+          <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
+            <CardTitle className="text-sm font-medium">Success Rate</CardTitle>
+            <CheckCircle className="h-4 w-4 text-muted-foreground" />
+          </CardHeader>
+          <CardContent>
+            <div className="text-2xl font-bold">{mockSystemStats.successRate}%</div>
+            <p className="text-xs text-muted-foreground">+2.1% from last week</p>
+          </CardContent>
+        </Card>
+
+        <Card className="hover:shadow-lg transition-shadow">
+          <CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2">
+            <CardTitle className="text-sm font-medium">Learning Patterns</CardTitle>
+            <Brain className="h-4 w-4 text-muted-foreground" />
+          </CardHeader>
+          <CardContent>
+            <div className="text-2xl font-bold">{mockSystemStats.learningPatterns}</div>
+            <p className="text-xs text-muted-foreground">Active patterns</p>
+          </CardContent>
+        </Card>
+      </div>
+
+      {/* Charts Section */}
+      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+        <Card>
+          <CardHeader>
+            <CardTitle>Performance Trends</CardTitle>
+            <CardDescription>Code quality, test coverage, and user satisfaction over time</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <ResponsiveContainer width="100%" height={300}>
+              <LineChart data={mockPerformanceData}>
+                <CartesianGrid strokeDasharray="3 3" />
+                <XAxis dataKey="name" />
+                <YAxis />
+                <Tooltip />
+                <Line type="monotone" dataKey="codeQuality" stroke="#8884d8" strokeWidth={2} />
+                <Line type="monotone" dataKey="testCoverage" stroke="#82ca9d" strokeWidth={2} />
+                <Line type="monotone" dataKey="userSatisfaction" stroke="#ffc658" strokeWidth={2} />
+              </LineChart>
+            </ResponsiveContainer>
+          </CardContent>
+        </Card>
+
+        <Card>
+          <CardHeader>
+            <CardTitle>Learning Distribution</CardTitle>
+            <CardDescription>Types of patterns the AI has learned</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <ResponsiveContainer width="100%" height={300}>
+              <PieChart>
+                <Pie
+                  data={mockLearningData}
+                  cx="50%"
+                  cy="50%"
+                  outerRadius={80}
+                  fill="#8884d8"
+                  dataKey="value"
+                  label={({ name, percent }) => `${name} ${(percent * 100).toFixed(0)}%`}
+                >
+                  {mockLearningData.map((entry, index) => (
+                    <Cell key={`cell-${index}`} fill={entry.color} />
+                  ))}
+                </Pie>
+                <Tooltip />
+              </PieChart>
+            </ResponsiveContainer>
+          </CardContent>
+        </Card>
+      </div>
+
+      {/* Recent Activities */}
+      <Card>
+        <CardHeader>
+          <CardTitle>Recent Activities</CardTitle>
+          <CardDescription>Latest system activities and operations</CardDescription>
+        </CardHeader>
+        <CardContent>
+          <ScrollArea className="h-64">
+            <div className="space-y-4">
+              {mockRecentActivities.map((activity) => (
+                <div key={activity.id} className="flex items-center gap-4 p-3 rounded-lg bg-muted/50">
+                  <div className={`w-2 h-2 rounded-full ${
+                    activity.status === 'success' ? 'bg-green-500' : 
+                    activity.status === 'warning' ? 'bg-yellow-500' : 'bg-red-500'
+                  }`} />
+                  <div className="flex-1">
+                    <p className="text-sm font-medium">{activity.description}</p>
+                    <p className="text-xs text-muted-foreground">{activity.timestamp}</p>
+                  </div>
+                  <Badge variant={activity.status === 'success' ? 'default' : 'secondary'}>
+                    {activity.type}
+                  </Badge>
+                </div>
+              ))}
+            </div>
+          </ScrollArea>
+        </CardContent>
+      </Card>
+    </div>
+  )
+}
+
+// Code Generation Component
+const CodeGeneration = () => {
+  const [task, setTask] = useState('')
+  const [language, setLanguage] = useState('python')
+  const [isGenerating, setIsGenerating] = useState(false)
+  const [generatedCode, setGeneratedCode] = useState('')
+
+  const handleGenerate = async () => {
+    setIsGenerating(true)
+    // Simulate code generation
+    setTimeout(() => {
+      setGeneratedCode(`def example_function(param1, param2):
+    """
+    Generated function based on your requirements.
+    
+    Args:
+        param1: First parameter
+        param2: Second parameter
+    
+    Returns:
+        Processed result
+    """
+    try:
+        result = param1 + param2
+        return result
+    except Exception as e:
+        print(f"Error: {e}")
+        return None`)
+      setIsGenerating(false)
+    }, 2000)
+  }
+
+  return (
+    <div className="space-y-6">
+      <div>
+        <h2 className="text-3xl font-bold text-foreground">Code Generation</h2>
+        <p className="text-muted-foreground">Generate high-quality code with AI assistance</p>
+      </div>
+
+      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+        <Card>
+          <CardHeader>
+            <CardTitle>Task Description</CardTitle>
+            <CardDescription>Describe what you want to create</CardDescription>
+          </CardHeader>
+          <CardContent className="space-y-4">
+            <Textarea
+              placeholder="Describe the function or code you want to generate..."
+              value={task}
+              onChange={(e) => setTask(e.target.value)}
+              className="min-h-32"
+            />
+            
+            <div className="flex gap-4">
+              <div className="flex-1">
+                <label className="text-sm font-medium">Language</label>
+                <Select value={language} onValueChange={setLanguage}>
+                  <SelectTrigger>
+                    <SelectValue />
+                  </SelectTrigger>
+                  <SelectContent>
+                    <SelectItem value="python">Python</SelectItem>
+                    <SelectItem value="javascript">JavaScript</SelectItem>
+                    <SelectItem value="typescript">TypeScript</SelectItem>
+                    <SelectItem value="java">Java</SelectItem>
+                    <SelectItem value="cpp">C++</SelectItem>
+                  </SelectContent>
+                </Select>
+              </div>
+            </div>
+
+            <Button 
+              onClick={handleGenerate} 
+              disabled={!task || isGenerating}
+              className="w-full"
+            >
+              {isGenerating ? (
+                <>
+                  <RefreshCw className="w-4 h-4 mr-2 animate-spin" />
+                  Generating...
+                </>
+              ) : (
+                <>
+                  <Zap className="w-4 h-4 mr-2" />
+                  Generate Code
+                </>
+              )}
+            </Button>
+          </CardContent>
+        </Card>
+
+        <Card>
+          <CardHeader>
+            <CardTitle>Generated Code</CardTitle>
+            <CardDescription>AI-generated code with best practices</CardDescription>
+          </CardHeader>
+          <CardContent>
+            {generatedCode ? (
+              <div className="space-y-4">
+                <pre className="bg-muted p-4 rounded-lg text-sm overflow-x-auto">
+                  <code>{generatedCode}</code>
+                </pre>
+                <div className="flex gap-2">
+                  <Button variant="outline" size="sm">
+                    <FileText className="w-4 h-4 mr-2" />
+                    Copy
+                  </Button>
+                  <Button variant="outline" size="sm">
+                    <Play className="w-4 h-4 mr-2" />
+                    Test
+                  </Button>
+                  <Button variant="outline" size="sm">
+                    <CheckCircle className="w-4 h-4 mr-2" />
+                    Analyze
+                  </Button>
+                </div>
+              </div>
+            ) : (
+              <div className="text-center py-12 text-muted-foreground">
+                <Code className="w-12 h-12 mx-auto mb-4 opacity-50" />
+                <p>Generated code will appear here</p>
+              </div>
+            )}
+          </CardContent>
+        </Card>
+      </div>
+
+      {/* Code Quality Metrics */}
+      <Card>
+        <CardHeader>
+          <CardTitle>Code Quality Metrics</CardTitle>
+          <CardDescription>Real-time analysis of generated code</CardDescription>
+        </CardHeader>
+        <CardContent>
+          <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+            <div className="space-y-2">
+              <div className="flex justify-between text-sm">
+                <span>Code Quality</span>
+                <span>95%</span>
+              </div>
+              <Progress value={95} className="h-2" />
+            </div>
+            <div className="space-y-2">
+              <div className="flex justify-between text-sm">
+                <span>Test Coverage</span>
+                <span>88%</span>
+              </div>
+              <Progress value={88} className="h-2" />
+            </div>
+            <div className="space-y-2">
+              <div className="flex justify-between text-sm">
+                <span>Documentation</span>
+                <span>92%</span>
+              </div>
+              <Progress value={92} className="h-2" />
+            </div>
+          </div>
+        </CardContent>
+      </Card>
+    </div>
+  )
+}
+
+// Knowledge Graph Component
+const KnowledgeGraph = () => {
+  return (
+    <div className="space-y-6">
+      <div>
+        <h2 className="text-3xl font-bold text-foreground">Knowledge Graph</h2>
+        <p className="text-muted-foreground">Explore the AI's knowledge network and relationships</p>
+      </div>
+
+      <div className="grid grid-cols-1 lg:grid-cols-3 gap-6">
+        <Card className="lg:col-span-2">
+          <CardHeader>
+            <CardTitle>Knowledge Network</CardTitle>
+            <CardDescription>Visual representation of learned concepts and relationships</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <div className="h-96 bg-muted/20 rounded-lg flex items-center justify-center">
+              <div className="text-center">
+                <Network className="w-16 h-16 mx-auto mb-4 text-muted-foreground" />
+                <p className="text-muted-foreground">Interactive knowledge graph visualization</p>
+                <p className="text-sm text-muted-foreground mt-2">
+                  {mockSystemStats.knowledgeEntities} entities • 1,247 relationships
+                </p>
+              </div>
+            </div>
+          </CardContent>
+        </Card>
+
+        <div className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>Search Knowledge</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="space-y-4">
+                <Input placeholder="Search entities, concepts..." />
+                <Button className="w-full">
+                  <Search className="w-4 h-4 mr-2" />
+                  Search
+                </Button>
+              </div>
+            </CardContent>
+          </Card>
+
+          <Card>
+            <CardHeader>
+              <CardTitle>Entity Types</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="space-y-3">
+                <div className="flex justify-between items-center">
+                  <span className="text-sm">Functions</span>
+                  <Badge variant="secondary">1,247</Badge>
+                </div>
+                <div className="flex justify-between items-center">
+                  <span className="text-sm">Classes</span>
+                  <Badge variant="secondary">892</Badge>
+                </div>
+                <div className="flex justify-between items-center">
+                  <span className="text-sm">Modules</span>
+                  <Badge variant="secondary">156</Badge>
+                </div>
+                <div className="flex justify-between items-center">
+                  <span className="text-sm">Concepts</span>
+                  <Badge variant="secondary">552</Badge>
+                </div>
+              </div>
+            </CardContent>
+          </Card>
+        </div>
+      </div>
+    </div>
+  )
+}
+
+// Learning Center Component
+const LearningCenter = () => {
+  return (
+    <div className="space-y-6">
+      <div>
+        <h2 className="text-3xl font-bold text-foreground">Learning Center</h2>
+        <p className="text-muted-foreground">Monitor and manage AI learning processes</p>
+      </div>
+
+      <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+        <Card>
+          <CardHeader>
+            <CardTitle>Learning Progress</CardTitle>
+            <CardDescription>Current learning metrics and improvements</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <div className="space-y-6">
+              <div className="space-y-2">
+                <div className="flex justify-between text-sm">
+                  <span>Pattern Recognition</span>
+                  <span>94%</span>
+                </div>
+                <Progress value={94} className="h-2" />
+              </div>
+              <div className="space-y-2">
+                <div className="flex justify-between text-sm">
+                  <span>Code Quality Learning</span>
+                  <span>87%</span>
+                </div>
+                <Progress value={87} className="h-2" />
+              </div>
+              <div className="space-y-2">
+                <div className="flex justify-between text-sm">
+                  <span>User Preference Adaptation</span>
+                  <span>91%</span>
+                </div>
+                <Progress value={91} className="h-2" />
+              </div>
+              <div className="space-y-2">
+                <div className="flex justify-between text-sm">
+                  <span>Error Prevention</span>
+                  <span>89%</span>
+                </div>
+                <Progress value={89} className="h-2" />
+              </div>
+            </div>
+          </CardContent>
+        </Card>
+
+        <Card>
+          <CardHeader>
+            <CardTitle>Recent Learning Events</CardTitle>
+            <CardDescription>Latest learning activities and insights</CardDescription>
+          </CardHeader>
+          <CardContent>
+            <ScrollArea className="h-64">
+              <div className="space-y-4">
+                {[
+                  { type: 'pattern', description: 'Learned new error handling pattern from user feedback', time: '5 min ago' },
+                  { type: 'optimization', description: 'Improved code generation speed by 15%', time: '12 min ago' },
+                  { type: 'preference', description: 'Adapted to user coding style preferences', time: '18 min ago' },
+                  { type: 'correction', description: 'Learned from code correction in project Alpha', time: '25 min ago' },
+                  { type: 'insight', description: 'Discovered new relationship between concepts', time: '32 min ago' }
+                ].map((event, index) => (
+                  <div key={index} className="flex items-start gap-3 p-3 rounded-lg bg-muted/50">
+                    <div className="w-2 h-2 bg-blue-500 rounded-full mt-2" />
+                    <div className="flex-1">
+                      <p className="text-sm font-medium">{event.description}</p>
+                      <p className="text-xs text-muted-foreground">{event.time}</p>
+                    </div>
+                    <Badge variant="outline" className="text-xs">
+                      {event.type}
+                    </Badge>
+                  </div>
+                ))}
+              </div>
+            </ScrollArea>
+          </CardContent>
+        </Card>
+      </div>
+
+      <Card>
+        <CardHeader>
+          <CardTitle>Learning Configuration</CardTitle>
+          <CardDescription>Adjust learning parameters and preferences</CardDescription>
+        </CardHeader>
+        <CardContent>
+          <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+            <div className="space-y-4">
+              <div className="flex items-center justify-between">
+                <label className="text-sm font-medium">Auto-learning from feedback</label>
+                <Switch defaultChecked />
+              </div>
+              <div className="flex items-center justify-between">
+                <label className="text-sm font-medium">Real-time pattern recognition</label>
+                <Switch defaultChecked />
+              </div>
+              <div className="flex items-center justify-between">
+                <label className="text-sm font-medium">Adaptive code generation</label>
+                <Switch defaultChecked />
+              </div>
+            </div>
+            <div className="space-y-4">
+              <div className="flex items-center justify-between">
+                <label className="text-sm font-medium">Performance optimization</label>
+                <Switch defaultChecked />
+              </div>
+              <div className="flex items-center justify-between">
+                <label className="text-sm font-medium">User preference tracking</label>
+                <Switch defaultChecked />
+              </div>
+              <div className="flex items-center justify-between">
+                <label className="text-sm font-medium">Error prevention learning</label>
+                <Switch defaultChecked />
+              </div>
+            </div>
+          </div>
+        </CardContent>
+      </Card>
+    </div>
+  )
+}
+
+// Analytics Component
+const Analytics = () => {
+  return (
+    <div className="space-y-6">
+      <div>
+        <h2 className="text-3xl font-bold text-foreground">Analytics</h2>
+        <p className="text-muted-foreground">Detailed insights and performance metrics</p>
+      </div>
+
+      <Tabs defaultValue="performance" className="space-y-6">
+        <TabsList className="grid w-full grid-cols-4">
+          <TabsTrigger value="performance">Performance</TabsTrigger>
+          <TabsTrigger value="usage">Usage</TabsTrigger>
+          <TabsTrigger value="quality">Quality</TabsTrigger>
+          <TabsTrigger value="learning">Learning</TabsTrigger>
+        </TabsList>
+
+        <TabsContent value="performance" className="space-y-6">
+          <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+            <Card>
+              <CardHeader>
+                <CardTitle>Response Time Trends</CardTitle>
+              </CardHeader>
+              <CardContent>
+                <ResponsiveContainer width="100%" height={300}>
+                  <AreaChart data={mockPerformanceData}>
+                    <CartesianGrid strokeDasharray="3 3" />
+                    <XAxis dataKey="name" />
+                    <YAxis />
+                    <Tooltip />
+                    <Area type="monotone" dataKey="codeQuality" stackId="1" stroke="#8884d8" fill="#8884d8" />
+                  </AreaChart>
+                </ResponsiveContainer>
+              </CardContent>
+            </Card>
+
+            <Card>
+              <CardHeader>
+                <CardTitle>System Resource Usage</CardTitle>
+              </CardHeader>
+              <CardContent>
+                <div className="space-y-4">
+                  <div className="space-y-2">
+                    <div className="flex justify-between text-sm">
+                      <span>CPU Usage</span>
+                      <span>45%</span>
+                    </div>
+                    <Progress value={45} className="h-2" />
+                  </div>
+                  <div className="space-y-2">
+                    <div className="flex justify-between text-sm">
+                      <span>Memory Usage</span>
+                      <span>67%</span>
+                    </div>
+                    <Progress value={67} className="h-2" />
+                  </div>
+                  <div className="space-y-2">
+                    <div className="flex justify-between text-sm">
+                      <span>Storage Usage</span>
+                      <span>23%</span>
+                    </div>
+                    <Progress value={23} className="h-2" />
+                  </div>
+                </div>
+              </CardContent>
+            </Card>
+          </div>
+        </TabsContent>
+
+        <TabsContent value="usage" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>Usage Statistics</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+                <div className="text-center">
+                  <div className="text-3xl font-bold text-primary">2,847</div>
+                  <p className="text-sm text-muted-foreground">Total Requests</p>
+                </div>
+                <div className="text-center">
+                  <div className="text-3xl font-bold text-primary">156</div>
+                  <p className="text-sm text-muted-foreground">Active Users</p>
+                </div>
+                <div className="text-center">
+                  <div className="text-3xl font-bold text-primary">94.2%</div>
+                  <p className="text-sm text-muted-foreground">Success Rate</p>
+                </div>
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+
+        <TabsContent value="quality" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>Code Quality Metrics</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <ResponsiveContainer width="100%" height={300}>
+                <BarChart data={mockPerformanceData}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis dataKey="name" />
+                  <YAxis />
+                  <Tooltip />
+                  <Bar dataKey="codeQuality" fill="#8884d8" />
+                  <Bar dataKey="testCoverage" fill="#82ca9d" />
+                </BarChart>
+              </ResponsiveContainer>
+            </CardContent>
+          </Card>
+        </TabsContent>
+
+        <TabsContent value="learning" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>Learning Velocity</CardTitle>
+            </CardHeader>
+            <CardContent>
+              <ResponsiveContainer width="100%" height={300}>
+                <LineChart data={mockPerformanceData}>
+                  <CartesianGrid strokeDasharray="3 3" />
+                  <XAxis dataKey="name" />
+                  <YAxis />
+                  <Tooltip />
+                  <Line type="monotone" dataKey="userSatisfaction" stroke="#ffc658" strokeWidth={3} />
+                </LineChart>
+              </ResponsiveContainer>
+            </CardContent>
+          </Card>
+        </TabsContent>
+      </Tabs>
+    </div>
+  )
+}
+
+// Settings Component
+const Settings = () => {
+  return (
+    <div className="space-y-6">
+      <div>
+        <h2 className="text-3xl font-bold text-foreground">Settings</h2>
+        <p className="text-muted-foreground">Configure your AI orchestration system</p>
+      </div>
+
+      <Tabs defaultValue="general" className="space-y-6">
+        <TabsList className="grid w-full grid-cols-4">
+          <TabsTrigger value="general">General</TabsTrigger>
+          <TabsTrigger value="ai">AI Configuration</TabsTrigger>
+          <TabsTrigger value="integrations">Integrations</TabsTrigger>
+          <TabsTrigger value="security">Security</TabsTrigger>
+        </TabsList>
+
+        <TabsContent value="general" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>General Settings</CardTitle>
+            </CardHeader>
+            <CardContent className="space-y-6">
+              <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+                <div className="space-y-2">
+                  <label className="text-sm font-medium">System Name</label>
+                  <Input defaultValue="Unified Orchestrator AI" />
+                </div>
+                <div className="space-y-2">
+                  <label className="text-sm font-medium">Default Language</label>
+                  <Select defaultValue="python">
+                    <SelectTrigger>
+                      <SelectValue />
+                    </SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="python">Python</SelectItem>
+                      <SelectItem value="javascript">JavaScript</SelectItem>
+                      <SelectItem value="typescript">TypeScript</SelectItem>
+                    </SelectContent>
+                  </Select>
+                </div>
+              </div>
+              
+              <Separator />
+              
+              <div className="space-y-4">
+                <h4 className="text-sm font-medium">Notifications</h4>
+                <div className="space-y-3">
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Email notifications</label>
+                    <Switch defaultChecked />
+                  </div>
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Push notifications</label>
+                    <Switch />
+                  </div>
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Learning updates</label>
+                    <Switch defaultChecked />
+                  </div>
+                </div>
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+
+        <TabsContent value="ai" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>AI Configuration</CardTitle>
+            </CardHeader>
+            <CardContent className="space-y-6">
+              <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
+                <div className="space-y-2">
+                  <label className="text-sm font-medium">Model Temperature</label>
+                  <Input type="number" defaultValue="0.7" step="0.1" min="0" max="1" />
+                </div>
+                <div className="space-y-2">
+                  <label className="text-sm font-medium">Max Tokens</label>
+                  <Input type="number" defaultValue="2048" />
+                </div>
+              </div>
+              
+              <div className="space-y-4">
+                <h4 className="text-sm font-medium">Learning Parameters</h4>
+                <div className="space-y-3">
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Aggressive learning</label>
+                    <Switch />
+                  </div>
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Conservative mode</label>
+                    <Switch defaultChecked />
+                  </div>
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Auto-optimization</label>
+                    <Switch defaultChecked />
+                  </div>
+                </div>
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+
+        <TabsContent value="integrations" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>External Integrations</CardTitle>
+            </CardHeader>
+            <CardContent className="space-y-6">
+              <div className="space-y-4">
+                {[
+                  { name: 'GitHub', status: 'connected', icon: GitBranch },
+                  { name: 'Hugging Face', status: 'connected', icon: Brain },
+                  { name: 'Docker', status: 'disconnected', icon: Layers },
+                  { name: 'Kaggle', status: 'connected', icon: Database }
+                ].map((integration) => {
+                  const Icon = integration.icon
+                  return (
+                    <div key={integration.name} className="flex items-center justify-between p-4 border rounded-lg">
+                      <div className="flex items-center gap-3">
+                        <Icon className="w-5 h-5" />
+                        <span className="font-medium">{integration.name}</span>
+                      </div>
+                      <div className="flex items-center gap-2">
+                        <Badge variant={integration.status === 'connected' ? 'default' : 'secondary'}>
+                          {integration.status}
+                        </Badge>
+                        <Button variant="outline" size="sm">
+                          {integration.status === 'connected' ? 'Configure' : 'Connect'}
+                        </Button>
+                      </div>
+                    </div>
+                  )
+                })}
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+
+        <TabsContent value="security" className="space-y-6">
+          <Card>
+            <CardHeader>
+              <CardTitle>Security Settings</CardTitle>
+            </CardHeader>
+            <CardContent className="space-y-6">
+              <div className="space-y-4">
+                <div className="flex items-center justify-between">
+                  <label className="text-sm font-medium">Two-factor authentication</label>
+                  <Switch />
+                </div>
+                <div className="flex items-center justify-between">
+                  <label className="text-sm font-medium">API key rotation</label>
+                  <Switch defaultChecked />
+                </div>
+                <div className="flex items-center justify-between">
+                  <label className="text-sm font-medium">Audit logging</label>
+                  <Switch defaultChecked />
+                </div>
+              </div>
+              
+              <Separator />
+              
+              <div className="space-y-4">
+                <h4 className="text-sm font-medium">Data Privacy</h4>
+                <div className="space-y-3">
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Encrypt stored data</label>
+                    <Switch defaultChecked />
+                  </div>
+                  <div className="flex items-center justify-between">
+                    <label className="text-sm">Anonymous analytics</label>
+                    <Switch defaultChecked />
+                  </div>
+                </div>
+              </div>
+            </CardContent>
+          </Card>
+        </TabsContent>
+      </Tabs>
+    </div>
+  )
+}
+
+// Main App Component
+function App() {
+  const [activeTab, setActiveTab] = useState('dashboard')
+
+  const renderContent = () => {
+    switch (activeTab) {
+      case 'dashboard':
+        return <Dashboard />
+      case 'code-generation':
+        return <CodeGeneration />
+      case 'knowledge-graph':
+        return <KnowledgeGraph />
+      case 'learning':
+        return <LearningCenter />
+      case 'analytics':
+        return <Analytics />
+      case 'settings':
+        return <Settings />
+      default:
+        return <Dashboard />
+    }
+  }
+
+  return (
+    <div className="flex h-screen bg-background">
+      <Navigation activeTab={activeTab} setActiveTab={setActiveTab} />
+      
+      <main className="flex-1 overflow-auto">
+        <div className="p-6">
+          <AnimatePresence mode="wait">
+            <motion.div
+              key={activeTab}
+              initial={{ opacity: 0, y: 20 }}
+              animate={{ opacity: 1, y: 0 }}
+              exit={{ opacity: 0, y: -20 }}
+              transition={{ duration: 0.2 }}
+            >
+              {renderContent()}
+            </motion.div>
+          </AnimatePresence>
+        </div>
+      </main>
+    </div>
+  )
+}
+
+export default App
+
@@ -0,0 +1,50 @@
+import os
+import json
+import sqlite3
+import random
+import hashlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict
+from enum import Enum
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import schedule
+import time
+import threading
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class DifficultyLevel(Enum):
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+    EXPERT = "expert"
+
+class ChallengeType(Enum):
+    ALGORITHM = "algorithm"
+    DATA_STRUCTURE = "data_structure"
+    WEB_DEVELOPMENT = "web_development"
+    MACHINE_LEARNING = "machine_learning"
+    SYSTEM_DESIGN = "system_design"
+    DATABASE = "database"
+    API_DEVELOPMENT = "api_development"
+    DEBUGGING = "debugging"
+    OPTIMIZATION = "optimization"
+    TESTING = "testing"
+
+class ChallengeStatus(Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    REVIEWED = "reviewed"
+
+@dataclass
+class Challenge:
+    """Represents a coding challenge"""
+    id: str
+    title: str
+    description: str
\ No newline at end of file